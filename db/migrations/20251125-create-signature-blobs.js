@@ -0,0 +1,116 @@
+// migrations/20251125-create-signature-blobs.js
+const { defaultCreate } = require('../migrationLib/createHelper.cjs');
+
+/** @type {import('sequelize-cli').Migration} */
+module.exports = {
+  async up(queryInterface, Sequelize) {
+    const tableOpts = { charset: 'utf8mb4', collate: 'utf8mb4_unicode_ci' };
+
+    // 서명 원본을 내용 해시(SHA-256) 기준으로 한 번만 저장
+    await queryInterface.createTable(
+      'signatureBlobs',
+      {
+        // 공통 컬럼(id, createdAt, updatedAt)
+        ...defaultCreate,
+
+        hash: {
+          type: Sequelize.CHAR(64),
+          allowNull: false,
+          comment: 'signatureData의 SHA-256 (hex)',
+        },
+
+        // LONGTEXT (base64 이미지 또는 텍스트 서명)
+        data: {
+          type: Sequelize.TEXT('long'),
+          allowNull: false,
+        },
+
+        byteSize: {
+          type: Sequelize.INTEGER,
+          allowNull: false,
+          defaultValue: 0,
+        },
+      },
+      tableOpts
+    );
+
+    await queryInterface.addIndex('signatureBlobs', ['hash'], {
+      name: 'ux_signatureBlobs_hash',
+      unique: true,
+    });
+
+    // userSignatures는 원본 대신 해시 참조만 보관
+    await queryInterface.addColumn(
+      'userSignatures',
+      'signatureHash',
+      {
+        type: Sequelize.CHAR(64),
+        allowNull: true,
+      },
+      { after: 'userId' }
+    );
+    await queryInterface.changeColumn('userSignatures', 'signatureData', {
+      type: Sequelize.TEXT('long'),
+      allowNull: true,
+    });
+
+    // 기존 데이터 이전: userSignatures / recommendation의 서명 원본 → signatureBlobs
+    await queryInterface.sequelize.query(`
+      INSERT IGNORE INTO signatureBlobs (hash, data, byteSize, createdAt, updatedAt)
+      SELECT SHA2(signatureData, 256), signatureData, LENGTH(signatureData), NOW(), NOW()
+      FROM userSignatures
+      WHERE signatureData IS NOT NULL
+    `);
+    await queryInterface.sequelize.query(`
+      UPDATE userSignatures
+      SET signatureHash = SHA2(signatureData, 256), signatureData = NULL
+      WHERE signatureData IS NOT NULL
+    `);
+
+    await queryInterface.sequelize.query(`
+      INSERT IGNORE INTO signatureBlobs (hash, data, byteSize, createdAt, updatedAt)
+      SELECT
+        SHA2(JSON_UNQUOTE(JSON_EXTRACT(signatureData, '$.data')), 256),
+        JSON_UNQUOTE(JSON_EXTRACT(signatureData, '$.data')),
+        LENGTH(JSON_UNQUOTE(JSON_EXTRACT(signatureData, '$.data'))),
+        NOW(), NOW()
+      FROM recommendation
+      WHERE JSON_VALID(signatureData) AND JSON_EXTRACT(signatureData, '$.data') IS NOT NULL
+    `);
+    // recommendation.signatureData: {"data": ..., "type": ...} → {"hash": ..., "type": ...}
+    await queryInterface.sequelize.query(`
+      UPDATE recommendation
+      SET signatureData = JSON_OBJECT(
+        'type', JSON_UNQUOTE(JSON_EXTRACT(signatureData, '$.type')),
+        'hash', SHA2(JSON_UNQUOTE(JSON_EXTRACT(signatureData, '$.data')), 256)
+      )
+      WHERE JSON_VALID(signatureData) AND JSON_EXTRACT(signatureData, '$.data') IS NOT NULL
+    `);
+  },
+
+  async down(queryInterface, Sequelize) {
+    // 해시 참조 → 원본 복원
+    await queryInterface.sequelize.query(`
+      UPDATE recommendation r
+      JOIN signatureBlobs b ON b.hash = JSON_UNQUOTE(JSON_EXTRACT(r.signatureData, '$.hash'))
+      SET r.signatureData = JSON_OBJECT(
+        'data', b.data,
+        'type', JSON_UNQUOTE(JSON_EXTRACT(r.signatureData, '$.type'))
+      )
+      WHERE JSON_VALID(r.signatureData)
+    `);
+    await queryInterface.sequelize.query(`
+      UPDATE userSignatures us
+      JOIN signatureBlobs b ON b.hash = us.signatureHash
+      SET us.signatureData = b.data
+      WHERE us.signatureData IS NULL
+    `);
+
+    await queryInterface.changeColumn('userSignatures', 'signatureData', {
+      type: Sequelize.TEXT('long'),
+      allowNull: false,
+    });
+    await queryInterface.removeColumn('userSignatures', 'signatureHash');
+    await queryInterface.dropTable('signatureBlobs');
+  },
+};
@@ -0,0 +1,39 @@
+// migrations/20251126-recommendation-add-template-tone.js
+// 평가 분석(양식별 / 문체별 / 기간별 집계)을 위해 추천서 생성 조건을 기록
+
+/** @type {import('sequelize-cli').Migration} */
+module.exports = {
+  async up(queryInterface, Sequelize) {
+    // 참고한 양식 (양식이 삭제되면 NULL)
+    await queryInterface.addColumn('recommendation', 'templateId', {
+      type: Sequelize.INTEGER,
+      allowNull: true,
+      comment: '참고한 양식 (recommendationTemplates.id)',
+      references: { model: 'recommendationTemplates', key: 'id' },
+      onUpdate: 'CASCADE',
+      onDelete: 'SET NULL',
+    });
+
+    // 생성 시 선택한 어조 (문체 분석을 사용한 경우 'WritingStyle')
+    await queryInterface.addColumn('recommendation', 'tone', {
+      type: Sequelize.STRING(32),
+      allowNull: true,
+      comment: '생성 어조 (Formal, Friendly, ... / WritingStyle)',
+    });
+
+    await queryInterface.addIndex('recommendation', ['templateId'], {
+      name: 'ix_recommendation_templateId',
+    });
+    // 기간별 집계용
+    await queryInterface.addIndex('recommendation', ['createdAt'], {
+      name: 'ix_recommendation_createdAt',
+    });
+  },
+
+  async down(queryInterface, _Sequelize) {
+    await queryInterface.removeIndex('recommendation', 'ix_recommendation_createdAt');
+    await queryInterface.removeIndex('recommendation', 'ix_recommendation_templateId');
+    await queryInterface.removeColumn('recommendation', 'tone');
+    await queryInterface.removeColumn('recommendation', 'templateId');
+  },
+};
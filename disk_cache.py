@@ -0,0 +1,175 @@
+"""
+로컬 디스크 LRU 캐시
+- 항목 하나 = 파일 하나 (키를 파일명으로 사용)
+- 전체 용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+- 마지막 사용 시각은 파일 atime, 저장 시각은 mtime으로 기록 (서버 재시작 후에도 LRU 순서 유지)
+- ttl_seconds를 주면 저장 후 그 시간이 지난 항목은 조회 시 만료 처리
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+_UNSAFE_KEY_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class DiskLRUCache:
+    """용량 제한이 있는 디스크 LRU 캐시"""
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = "", ttl_seconds: Optional[int] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # 파일명 -> 크기 (오래된 순)
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """디스크에 남아 있는 항목을 마지막 사용 순으로 인덱스에 올립니다."""
+        files = []
+        for name in os.listdir(self.directory):
+            if name.startswith(".tmp-"):
+                # 쓰는 도중 중단된 임시 파일
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            files.append((max(st.st_atime, st.st_mtime), name, st.st_size))
+
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _filename(self, key: str) -> str:
+        return _UNSAFE_KEY_CHARS.sub("_", key) + self.suffix
+
+    def get_path(self, key: str) -> Optional[str]:
+        """캐시된 파일 경로를 반환합니다 (없거나 만료되면 None). 조회 시 최근 사용으로 갱신."""
+        name = self._filename(key)
+        path = os.path.join(self.directory, name)
+        with self._lock:
+            try:
+                st = os.stat(path) if name in self._entries else None
+            except OSError:
+                st = None
+            if st is None:
+                self._forget(name)
+                self.misses += 1
+                return None
+            if self.ttl_seconds is not None and time.time() - st.st_mtime > self.ttl_seconds:
+                self._forget(name)
+                self.expirations += 1
+                self.misses += 1
+                expired = True
+            else:
+                self._entries.move_to_end(name)
+                self.hits += 1
+                expired = False
+        if expired:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            # 사용 시각(atime)만 갱신하고 저장 시각(mtime)은 유지 (TTL 기준)
+            os.utime(path, (time.time(), st.st_mtime))
+        except OSError:
+            pass
+        return path
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes) -> str:
+        """항목을 저장하고 파일 경로를 반환합니다 (임시 파일에 쓴 뒤 교체)."""
+        name = self._filename(key)
+        path = os.path.join(self.directory, name)
+        tmp_path = os.path.join(self.directory, f".tmp-{os.getpid()}-{threading.get_ident()}-{name}")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._forget(name)
+            self._entries[name] = len(data)
+            self._total_bytes += len(data)
+            self._evict(keep=name)
+        return path
+
+    def delete(self, key: str) -> None:
+        name = self._filename(key)
+        with self._lock:
+            self._forget(name)
+        try:
+            os.remove(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def delete_prefix(self, prefix: str) -> int:
+        """키가 prefix로 시작하는 항목을 모두 삭제합니다."""
+        name_prefix = _UNSAFE_KEY_CHARS.sub("_", prefix)
+        with self._lock:
+            names = [name for name in self._entries if name.startswith(name_prefix)]
+            for name in names:
+                self._forget(name)
+        for name in names:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        return len(names)
+
+    def _forget(self, name: str) -> None:
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """용량 상한을 넘는 동안 가장 오래된 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        while self._total_bytes > self.max_bytes and self._entries:
+            name, size = next(iter(self._entries.items()))
+            if name == keep and len(self._entries) == 1:
+                break
+            self._entries.pop(name)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
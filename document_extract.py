@@ -0,0 +1,175 @@
+"""
+업로드 문서 텍스트 추출 (TXT / DOCX / PDF)
+- server.py의 프로세스 풀 워커에서 실행 (이벤트 루프를 막지 않음)
+- 큰 PDF는 페이지 구간으로 나눠 여러 워커가 동시에 추출
+- TXT 인코딩 감지는 앞부분 샘플만 사용 (파일 전체를 chardet에 넘기지 않음)
+- 스캔 PDF: 텍스트가 없는 페이지만 래스터화해 OCR (pytesseract, 페이지별로 워커에서 실행)
+"""
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import List, Optional, Tuple
+
+import chardet
+import docx
+import PyPDF2
+from PIL import Image
+
+SUPPORTED_EXTENSIONS = ('.txt', '.docx', '.pdf')
+
+# 인코딩 감지에 사용하는 앞부분 샘플 크기
+CHARDET_SAMPLE_BYTES = 64 * 1024
+
+
+def decode_text(content: bytes) -> str:
+    """TXT 파일 디코딩: UTF-8 우선, 실패하면 앞부분 샘플로 인코딩 감지"""
+    try:
+        return content.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        pass
+    detected = chardet.detect(content[:CHARDET_SAMPLE_BYTES])
+    encoding = detected.get('encoding') or 'cp949'
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode('cp949', errors='replace')
+
+
+def extract_docx_text(content: bytes) -> str:
+    doc = docx.Document(io.BytesIO(content))
+    return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+
+
+def extract_plain_document(extension: str, content: bytes) -> str:
+    """TXT / DOCX 텍스트 추출 (워커에서 실행)"""
+    if extension == '.txt':
+        return decode_text(content)
+    if extension == '.docx':
+        return extract_docx_text(content)
+    raise ValueError(f"지원하지 않는 파일 형식: {extension}")
+
+
+def pdf_page_count(content: bytes) -> int:
+    """PDF 페이지 수 (페이지 트리만 읽음, 본문 추출 없음)"""
+    return len(PyPDF2.PdfReader(io.BytesIO(content)).pages)
+
+
+def extract_pdf_pages(content: bytes, start: int, end: int) -> List[str]:
+    """PDF의 [start, end) 페이지 텍스트 추출 (워커에서 실행, 페이지별 결과 유지)"""
+    reader = PyPDF2.PdfReader(io.BytesIO(content))
+    texts = []
+    for index in range(start, min(end, len(reader.pages))):
+        texts.append(reader.pages[index].extract_text() or '')
+    return texts
+
+
+def page_ranges(page_count: int, pages_per_task: int) -> List[Tuple[int, int]]:
+    """페이지 구간 분할: [(0, n), (n, 2n), ...]"""
+    pages_per_task = max(1, pages_per_task)
+    return [(start, min(start + pages_per_task, page_count))
+            for start in range(0, page_count, pages_per_task)]
+
+
+# ===== OCR (스캔 PDF) =====
+OCR_LANG = os.getenv("OCR_LANG", "kor+eng")
+OCR_DPI = int(os.getenv("OCR_DPI", "200"))
+# 이 글자 수 미만이면 텍스트 레이어가 없는 페이지로 보고 OCR 대상
+OCR_MIN_PAGE_CHARS = 10
+
+
+def ocr_available() -> bool:
+    """tesseract 실행 파일이 있는지 확인"""
+    try:
+        import pytesseract
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+
+def init_ocr_worker() -> None:
+    """OCR 워커 초기화: 워커 여러 개가 동시에 돌므로 tesseract 내부 스레드는 1개로 제한"""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def needs_ocr(page_text: str) -> bool:
+    return len((page_text or '').strip()) < OCR_MIN_PAGE_CHARS
+
+
+def _rasterize_page(content: bytes, index: int) -> List[Image.Image]:
+    """
+    PDF 한 페이지를 이미지로 변환
+    - poppler(pdftoppm)가 있으면 페이지 전체를 OCR_DPI로 래스터화
+    - 없으면 페이지에 포함된 이미지(스캔 PDF는 보통 페이지당 한 장)를 그대로 사용
+    """
+    if shutil.which("pdftoppm"):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = os.path.join(tmp_dir, "doc.pdf")
+            with open(pdf_path, "wb") as f:
+                f.write(content)
+            out_prefix = os.path.join(tmp_dir, "page")
+            subprocess.run(
+                ["pdftoppm", "-f", str(index + 1), "-l", str(index + 1), "-r", str(OCR_DPI),
+                 "-gray", "-png", "-singlefile", pdf_path, out_prefix],
+                check=True, capture_output=True, timeout=60
+            )
+            with Image.open(out_prefix + ".png") as img:
+                img.load()
+                return [img.copy()]
+
+    page = PyPDF2.PdfReader(io.BytesIO(content)).pages[index]
+    return list(_xobject_images(page.get('/Resources')))
+
+
+def _decode_image_xobject(xobj) -> Optional[Image.Image]:
+    from PyPDF2.filters import _xobj_to_image
+
+    try:
+        extension, data = _xobj_to_image(xobj)
+        if extension is not None:
+            img = Image.open(io.BytesIO(data))
+            img.load()
+            return img
+    except Exception:
+        pass
+    # 필터가 여러 개 겹친 경우 등: 디코딩된 원시 픽셀로 구성 (8비트 RGB / Gray만)
+    mode = {'/DeviceRGB': 'RGB', '/DeviceGray': 'L'}.get(xobj.get('/ColorSpace'))
+    if mode and xobj.get('/BitsPerComponent') == 8:
+        try:
+            return Image.frombytes(mode, (int(xobj['/Width']), int(xobj['/Height'])), xobj.get_data())
+        except Exception:
+            return None
+    return None
+
+
+def _xobject_images(resources, depth: int = 0):
+    """페이지 리소스의 이미지 XObject (Form XObject 안에 들어 있는 이미지 포함)"""
+    if not resources or depth > 3:
+        return
+    resources = resources.get_object()
+    if '/XObject' not in resources:
+        return
+    xobjects = resources['/XObject'].get_object()
+    for name in xobjects:
+        xobj = xobjects[name].get_object()
+        subtype = xobj.get('/Subtype')
+        if subtype == '/Image':
+            img = _decode_image_xobject(xobj)
+            if img is not None:
+                yield img
+        elif subtype == '/Form':
+            yield from _xobject_images(xobj.get('/Resources'), depth + 1)
+
+
+def ocr_pdf_page(content: bytes, index: int) -> str:
+    """PDF 한 페이지 OCR (워커에서 실행)"""
+    import pytesseract
+
+    texts = []
+    for img in _rasterize_page(content, index):
+        if img.mode not in ('L', 'RGB'):
+            img = img.convert('RGB')
+        texts.append(pytesseract.image_to_string(img, lang=OCR_LANG).strip())
+    return '\n'.join(text for text in texts if text)
@@ -0,0 +1,196 @@
+"""
+추천서 로컬 휴리스틱 예비 평가
+- GPT 호출 없이 텍스트 특징만으로 5가지 기준(RecoEvaluator.criteria) 예비 점수를 즉시 계산
+- 특징: 목표 분량 대비 길이, 구체적 숫자/날짜 수, 문장 길이 분산, 상투적 표현 반복, 문단 구조, 추천 의사 표현
+- 특징 행렬(추천서 N개 × 특징) × 가중치 행렬(특징 × 기준)로 여러 추천서를 한 번에 계산 (NumPy)
+- 분량 미달/추천 의사 없음 같은 결정적 결함은 가중 평균과 별도로 관련 기준 점수 상한을 적용
+- 예비 점수가 경계 구간이거나, 결정적 결함이 있는데 점수가 낮지 않으면 GPT 정밀 평가가 필요한 것으로 판단
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+CRITERIA = ["accuracy", "professionalism", "coherence", "personalization", "persuasiveness"]
+
+FEATURES = [
+    "length_fit",          # 목표 분량 범위 안이면 1
+    "concrete_density",    # 1000자당 숫자/날짜/기간 표현
+    "sentence_variety",    # 문장 길이 변동계수가 적당하면 1
+    "sentence_length_fit", # 평균 문장 길이가 읽기 좋은 범위면 1
+    "stock_phrase_free",   # 상투적 칭찬 표현이 적을수록 1
+    "repetition_free",     # 같은 어절 반복이 적을수록 1
+    "paragraph_structure", # 문단 3~6개면 1
+    "recommend_intent",    # 명시적 추천 문장이 있으면 1
+]
+
+# 특징 → 기준 가중치 (열 합 = 1, 점수 = 1 + 4 × 가중 평균의 내림, 모든 특징이 충족돼야 5점)
+WEIGHTS = np.array([
+    # acc   prof  coh   pers  persu
+    [0.10, 0.10, 0.10, 0.05, 0.10],  # length_fit
+    [0.40, 0.00, 0.05, 0.40, 0.25],  # concrete_density
+    [0.00, 0.25, 0.15, 0.00, 0.05],  # sentence_variety
+    [0.05, 0.30, 0.15, 0.00, 0.05],  # sentence_length_fit
+    [0.35, 0.15, 0.00, 0.35, 0.15],  # stock_phrase_free
+    [0.00, 0.20, 0.10, 0.15, 0.05],  # repetition_free
+    [0.05, 0.00, 0.45, 0.00, 0.05],  # paragraph_structure
+    [0.05, 0.00, 0.00, 0.05, 0.30],  # recommend_intent
+])
+
+# 추천서 목표 분량 (공백 제외 글자 수)
+DEFAULT_TARGET_CHARS = (700, 2500)
+
+# 누구에게나 쓸 수 있는 상투적 칭찬 표현
+STOCK_PHRASES = [
+    "성실", "책임감", "열정", "최선을 다", "적극적", "긍정적", "뛰어난", "훌륭한", "우수한",
+    "리더십", "모범", "노력하는", "믿음직", "인재", "자신 있게", "의심의 여지", "틀림없",
+]
+_STOCK_PATTERN = re.compile("|".join(re.escape(phrase) for phrase in STOCK_PHRASES))
+_CONCRETE_PATTERN = re.compile(
+    r"\d{4}\s*년|\d{1,2}\s*월|\d{1,2}\s*일|\d+(?:\.\d+)?\s*(?:%|퍼센트|명|개|건|회|위|점|배|시간|주|개월|년간|만\s*원|억)"
+    r"|\d+(?:[.,]\d+)+|\b\d+\b"
+)
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。])\s+|(?<=다\.)|\n+")
+_RECOMMEND_PATTERN = re.compile(r"추천(?:합니다|드립니다|하는 바입니다|하고자 합니다|할 수 있)|강력히|적극\s*추천")
+
+# 이 구간 안의 예비 점수(%)는 휴리스틱만으로 판단하기 어려워 GPT 정밀 평가 대상
+BORDERLINE_RANGE = (40.0, 70.0)
+
+# 결정적 결함: 특징값이 기준 미만이면 해당 기준 점수를 상한으로 제한
+# (가중 평균에서는 조금만 깎여 짧거나 추천 의사가 없는 글도 만점이 나올 수 있으므로)
+HARD_FAILURES = {
+    # 특징: (기준값, 점수 상한, 적용 기준)
+    "length_fit": (0.5, 3, ["coherence", "personalization", "persuasiveness"]),
+    "recommend_intent": (0.5, 2, ["persuasiveness"]),
+}
+
+
+def _band(value: np.ndarray, low: float, high: float, softness: float) -> np.ndarray:
+    """[low, high] 안이면 1, 벗어난 만큼 softness 비율로 0까지 감소"""
+    below = np.clip((low - value) / (low * softness), 0, 1)
+    above = np.clip((value - high) / (high * softness), 0, 1)
+    return 1.0 - np.maximum(below, above)
+
+
+def _raw_features(text: str) -> Tuple[float, ...]:
+    """추천서 1개의 원시 측정값 (정규식 집계, 정규화는 extract_features에서 일괄 처리)"""
+    body = text.strip()
+    chars = len(re.sub(r"\s", "", body))
+    sentences = [s.strip() for s in _SENTENCE_SPLIT.split(body) if s and len(s.strip()) > 1]
+    sentence_lengths = np.array([len(s) for s in sentences], dtype=float) if sentences else np.zeros(1)
+    mean_len = float(sentence_lengths.mean())
+    cv = float(sentence_lengths.std() / mean_len) if mean_len else 0.0
+
+    words = re.findall(r"[가-힣A-Za-z]{2,}", body)
+    if words:
+        _, counts = np.unique(np.array(words), return_counts=True)
+        # 3번 이상 나온 어절이 전체에서 차지하는 비율
+        repeated_ratio = float(counts[counts >= 3].sum() / len(words))
+    else:
+        repeated_ratio = 1.0
+
+    paragraphs = len([p for p in re.split(r"\n\s*\n|\n", body) if p.strip()])
+    return (
+        chars,
+        len(_CONCRETE_PATTERN.findall(body)),
+        cv,
+        mean_len,
+        len(_STOCK_PATTERN.findall(body)),
+        repeated_ratio,
+        paragraphs,
+        1.0 if _RECOMMEND_PATTERN.search(body) else 0.0,
+    )
+
+
+def extract_features(texts: List[str], target_chars: Tuple[int, int] = DEFAULT_TARGET_CHARS) -> np.ndarray:
+    """추천서 N개 → 특징 행렬 (N × len(FEATURES)), 각 값 0~1"""
+    raw = np.array([_raw_features(text) for text in texts], dtype=float).reshape(-1, len(FEATURES))
+    chars, concrete, cv, mean_len, stock, repeated, paragraphs, intent = raw.T
+    per_k = 1000.0 / np.maximum(chars, 1)
+
+    features = np.column_stack([
+        _band(chars, target_chars[0], target_chars[1], 0.8),
+        np.clip(concrete * per_k / 6.0, 0, 1),
+        _band(cv, 0.25, 0.6, 1.0),
+        _band(mean_len, 25, 90, 1.0),
+        1.0 - np.clip(stock * per_k / 8.0, 0, 1),
+        1.0 - np.clip((repeated - 0.15) / 0.35, 0, 1),
+        _band(paragraphs, 3, 6, 1.0),
+        intent,
+    ])
+    # 빈 텍스트는 모든 특징 0
+    features[chars == 0] = 0.0
+    return features
+
+
+def _hard_failures(features: np.ndarray) -> np.ndarray:
+    """추천서 N개 → 결정적 결함 여부 (N × len(HARD_FAILURES))"""
+    columns = [features[:, FEATURES.index(name)] < threshold for name, (threshold, _, _) in HARD_FAILURES.items()]
+    return np.column_stack(columns) if columns else np.zeros((len(features), 0), dtype=bool)
+
+
+def _scores_from_features(features: np.ndarray) -> np.ndarray:
+    # 반올림하면 4.5가 5점이 되므로 내림 (부동소수 오차로 정확히 5가 4가 되지 않도록 작은 여유)
+    scores = np.floor(1.0 + 4.0 * (features @ WEIGHTS) + 1e-9).clip(1, 5).astype(int)
+    failures = _hard_failures(features)
+    for index, (_, cap, criteria) in enumerate(HARD_FAILURES.values()):
+        columns = [CRITERIA.index(key) for key in criteria]
+        capped = np.minimum(scores[:, columns], cap)
+        scores[:, columns] = np.where(failures[:, [index]], capped, scores[:, columns])
+    return scores
+
+
+def score_many(texts: List[str], target_chars: Tuple[int, int] = DEFAULT_TARGET_CHARS) -> np.ndarray:
+    """추천서 N개 → 기준별 예비 점수 행렬 (N × 5, 1~5 정수)"""
+    return _scores_from_features(extract_features(texts, target_chars))
+
+
+def _reasons(features: np.ndarray, scores: Dict[str, int]) -> Dict[str, str]:
+    """기준별로 점수를 가장 많이 깎은 특징을 이유로 설명 (5점 기준은 약점을 적지 않음, 결정적 결함이 우선)"""
+    messages = {
+        "length_fit": "분량이 권장 범위를 벗어났습니다",
+        "concrete_density": "구체적인 숫자·날짜·성과 수치가 부족합니다",
+        "sentence_variety": "문장 길이가 단조롭습니다",
+        "sentence_length_fit": "문장이 너무 길거나 짧습니다",
+        "stock_phrase_free": "'성실', '책임감' 같은 일반적인 칭찬 표현이 많습니다",
+        "repetition_free": "같은 표현이 반복됩니다",
+        "paragraph_structure": "문단 구성(도입-사례-결론)이 뚜렷하지 않습니다",
+        "recommend_intent": "명시적인 추천 문장이 없습니다",
+    }
+    failed = [name for name, hit in zip(HARD_FAILURES, _hard_failures(features[np.newaxis])[0]) if hit]
+    reasons = {}
+    for column, key in enumerate(CRITERIA):
+        if scores[key] >= 5:
+            reasons[key] = f"예비 점수 {scores[key]}점 (특이한 약점 없음)"
+            continue
+        # 이 기준에 상한을 건 결정적 결함, 없으면 가중치 × 부족분이 가장 큰 특징
+        capping = [name for name in failed if key in HARD_FAILURES[name][2]]
+        shortfall = WEIGHTS[:, column] * (1.0 - features)
+        worst = capping[0] if capping else FEATURES[int(np.argmax(shortfall))]
+        reasons[key] = f"예비 점수 {scores[key]}점 - {messages[worst]}"
+    return reasons
+
+
+def heuristic_evaluate(text: str, target_chars: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """
+    추천서 1개 예비 평가 (RecoEvaluator.evaluate_single_recommendation과 같은 결과 형식)
+
+    Returns:
+        Dict: scores / reasons / average_score / percentage / features / borderline
+    """
+    features = extract_features([text], target_chars or DEFAULT_TARGET_CHARS)
+    score_row = _scores_from_features(features)[0]
+    hard_failure = bool(_hard_failures(features)[0].any())
+    scores = {key: int(score) for key, score in zip(CRITERIA, score_row)}
+    average_score = float(score_row.mean())
+    percentage = round((average_score - 1) / 4 * 100, 2)
+    return {
+        "scores": scores,
+        "reasons": _reasons(features[0], scores),
+        "average_score": round(average_score, 2),
+        "percentage": percentage,
+        "features": {name: round(float(value), 3) for name, value in zip(FEATURES, features[0])},
+        # 결정적 결함이 있으면 점수가 분명히 낮은 경우가 아니면 휴리스틱만으로 확정하지 않음
+        "borderline": BORDERLINE_RANGE[0] <= percentage and (percentage <= BORDERLINE_RANGE[1] or hard_failure),
+        "raw_response": "",
+    }
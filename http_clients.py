@@ -0,0 +1,121 @@
+"""
+외부 API(OpenAI / Anthropic) 호출용 공유 HTTP 클라이언트
+- 프로세스 전체에서 httpx.Client(동기) / httpx.AsyncClient(비동기) 하나씩을 공유해 keep-alive 연결을 재사용 (호출마다 TCP/TLS 연결을 새로 맺지 않음)
+- 연결 수 / keep-alive 유지 시간 / 타임아웃은 환경 변수로 조정
+- 요청 수, 새 연결 수(핸드셰이크), 풀 연결 상태 지표 제공
+- LLM_PROVIDER_MODE가 record / replay / fake면 네트워크 transport 대신 기록 / 재생 / 합성 transport 사용 (llm_providers)
+"""
+import os
+import threading
+
+import httpx
+
+from llm_providers import build_async_transport, build_transport
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+# 유휴 연결 유지 시간 (API 서버 쪽 idle timeout보다 짧게)
+HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+HTTP_CONNECT_TIMEOUT_SECONDS = float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "10"))
+# 요청별 timeout을 주지 않는 호출의 기본값 (SDK 기본값과 동일한 10분)
+HTTP_READ_TIMEOUT_SECONDS = float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "600"))
+
+
+class SharedHttpClient:
+    """연결 풀을 공유하는 httpx.Client / AsyncClient 래퍼 (OpenAI / Anthropic SDK에 http_client로 전달)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+        self.status_counts = {}
+
+        # transport를 직접 만들면 Client의 limits 인자는 무시되므로 transport에 지정
+        limits = httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS
+        )
+        timeout = httpx.Timeout(HTTP_READ_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+        self._network = httpx.HTTPTransport(limits=limits)
+        self.transport = build_transport(self._network)
+        self.client = httpx.Client(
+            transport=self.transport,
+            timeout=timeout,
+            follow_redirects=True,
+            event_hooks={"request": [self._on_request], "response": [self._on_response]}
+        )
+
+        # ainvoke / abatch 등 비동기 호출용 (연결 풀은 이벤트 루프 쪽에 따로 유지, 지표는 공유)
+        self._async_network = httpx.AsyncHTTPTransport(limits=limits)
+        self.async_client = httpx.AsyncClient(
+            transport=build_async_transport(self._async_network, self.transport),
+            timeout=timeout,
+            follow_redirects=True,
+            event_hooks={"request": [self._on_async_request], "response": [self._on_async_response]}
+        )
+
+    def _trace(self, event_name: str, info: dict) -> None:
+        # httpcore가 새 연결을 맺을 때만 발생 (재사용된 연결에서는 없음)
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            with self._lock:
+                self.tls_handshakes += 1
+
+    def _on_request(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    def _on_response(self, response: httpx.Response) -> None:
+        status_class = f"{response.status_code // 100}xx"
+        with self._lock:
+            self.status_counts[status_class] = self.status_counts.get(status_class, 0) + 1
+            if response.status_code >= 500 or response.status_code == 429:
+                self.errors += 1
+
+    async def _atrace(self, event_name: str, info: dict) -> None:
+        self._trace(event_name, info)
+
+    async def _on_async_request(self, request: httpx.Request) -> None:
+        self._on_request(request)
+        # 비동기 httpcore는 trace 콜백도 코루틴이어야 함
+        request.extensions["trace"] = self._atrace
+
+    async def _on_async_response(self, response: httpx.Response) -> None:
+        self._on_response(response)
+
+    def close(self) -> None:
+        self.client.close()
+
+    async def aclose(self) -> None:
+        await self.async_client.aclose()
+
+    def stats(self) -> dict:
+        # 풀 상태는 httpcore 연결 목록에서 직접 집계
+        connections = []
+        for network in (self._network, self._async_network):
+            pool = getattr(network, "_pool", None)
+            connections.extend(getattr(pool, "connections", []) or [])
+        idle = sum(1 for connection in connections if connection.is_idle())
+        with self._lock:
+            reused = self.requests - self.connections_opened
+            return {
+                "max_connections": HTTP_MAX_CONNECTIONS,
+                "max_keepalive_connections": HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                "keepalive_expiry_seconds": HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                "open_connections": len(connections),
+                "idle_connections": idle,
+                "active_connections": len(connections) - idle,
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "tls_handshakes": self.tls_handshakes,
+                "connection_reuse_ratio": round(max(0, reused) / self.requests, 3) if self.requests else 0.0,
+                "errors": self.errors,
+                "status_counts": dict(self.status_counts),
+                "provider": self.transport.stats() if hasattr(self.transport, "stats") else {"mode": "live"},
+            }
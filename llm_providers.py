@@ -0,0 +1,537 @@
+"""
+외부 LLM / 음성 API 호출 기록 · 재생 (네트워크 없이 벤치마크 / 회귀 테스트)
+- LLM_PROVIDER_MODE=live   : API를 그대로 호출 (기본)
+- LLM_PROVIDER_MODE=record : API를 호출하고 성공 응답을 cassette 파일로 저장
+- LLM_PROVIDER_MODE=replay : API를 호출하지 않고 저장된 cassette로 응답 (기록된 지연 시간 재현)
+- LLM_PROVIDER_MODE=fake   : API를 호출하지 않고 요청 형식에 맞는 합성 응답 생성 (부하 테스트, 지연 / 오류 주입)
+- 공유 httpx 클라이언트의 transport 단계에서 동작하므로 llm.invoke / openai_client / RecoEvaluator 호출 코드는 그대로 사용
+- cassette 키 = 요청 메서드 + 호스트 + 경로 + 본문 해시 (JSON은 키 정렬, multipart는 boundary 제거 후)
+- 실행 시점마다 바뀌는 프롬프트 내용(작성일 "YYYY년 MM월 DD일" 등)은 해시 전에 자리표시자로 바꿈
+  → 다른 날 재생해도 같은 키 (추가 패턴은 LLM_CASSETTE_VOLATILE_PATTERNS에 정규식 JSON 배열로 지정)
+  → 자리표시자로 바뀐 부분만 다른 요청은 같은 응답을 공유하고, 재생 응답에는 기록 당시의 날짜가 그대로 남음
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+import httpx
+
+LLM_PROVIDER_MODE = os.getenv("LLM_PROVIDER_MODE", "live").strip().lower()
+PROVIDER_MODES = ("live", "record", "replay", "fake")
+# 실제 API를 호출하지 않는 모드 (API 키가 없어도 서버 기동)
+OFFLINE_PROVIDER_MODES = ("replay", "fake")
+OFFLINE_API_KEY = "offline"
+
+LLM_CASSETTE_DIR = os.getenv("LLM_CASSETTE_DIR", os.path.join(os.path.dirname(__file__), "cassettes"))
+# 재생 지연: "recorded"(기록 당시 응답 시간) 또는 고정 밀리초
+LLM_REPLAY_LATENCY = os.getenv("LLM_REPLAY_LATENCY", "recorded").strip().lower()
+# 재생 지연 배율 (0이면 지연 없이 즉시 응답)
+LLM_REPLAY_LATENCY_SCALE = float(os.getenv("LLM_REPLAY_LATENCY_SCALE", "1.0"))
+
+# 합성 응답 지연 = 로그정규분포(중앙값, sigma) + 출력 1000자당 추가 시간
+LLM_FAKE_LATENCY_MS = float(os.getenv("LLM_FAKE_LATENCY_MS", "500"))
+LLM_FAKE_LATENCY_SIGMA = float(os.getenv("LLM_FAKE_LATENCY_SIGMA", "0.5"))
+LLM_FAKE_LATENCY_MS_PER_1K_CHARS = float(os.getenv("LLM_FAKE_LATENCY_MS_PER_1K_CHARS", "1000"))
+# 오류 주입 비율 (0~1): 429 rate limit / 529 과부하(OpenAI는 503) / 500 서버 오류
+LLM_FAKE_RATE_LIMIT_RATE = float(os.getenv("LLM_FAKE_RATE_LIMIT_RATE", "0"))
+LLM_FAKE_OVERLOAD_RATE = float(os.getenv("LLM_FAKE_OVERLOAD_RATE", "0"))
+LLM_FAKE_ERROR_RATE = float(os.getenv("LLM_FAKE_ERROR_RATE", "0"))
+LLM_FAKE_RETRY_AFTER_SECONDS = os.getenv("LLM_FAKE_RETRY_AFTER_SECONDS", "1")
+# 같은 시드 + 같은 요청 순서면 지연 / 오류 발생이 동일하게 재현됨 (응답 본문은 요청 내용으로만 결정)
+LLM_FAKE_SEED = int(os.getenv("LLM_FAKE_SEED", "0"))
+
+if LLM_PROVIDER_MODE not in PROVIDER_MODES:
+    raise ValueError(f"LLM_PROVIDER_MODE는 {', '.join(PROVIDER_MODES)} 중 하나여야 합니다: {LLM_PROVIDER_MODE}")
+
+# cassette 키 계산 전에 자리표시자로 바꾸는 실행 시점 의존 내용 (build_recommendation_prompt의 작성일 등)
+DEFAULT_VOLATILE_PATTERNS = [r"\d{4}년 \d{1,2}월 \d{1,2}일"]
+CASSETTE_VOLATILE_PATTERNS = [
+    re.compile(pattern)
+    for pattern in DEFAULT_VOLATILE_PATTERNS + json.loads(os.getenv("LLM_CASSETTE_VOLATILE_PATTERNS", "[]"))
+]
+VOLATILE_PLACEHOLDER = "<VOLATILE>"
+
+# 재생 응답에 그대로 옮기지 않는 헤더 (본문은 압축 해제된 상태로 저장)
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+def is_offline() -> bool:
+    return LLM_PROVIDER_MODE in OFFLINE_PROVIDER_MODES
+
+
+class CassetteStore:
+    """요청 해시 → 응답 파일 저장소 ({directory}/{키 앞 2자리}/{키}.json)"""
+
+    def __init__(self, directory: str = LLM_CASSETTE_DIR):
+        self.directory = directory
+
+    @staticmethod
+    def normalize_volatile(body: bytes) -> bytes:
+        """실행 시점마다 바뀌는 내용을 자리표시자로 바꿈 (UTF-8 텍스트 본문만)"""
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return body
+        for pattern in CASSETTE_VOLATILE_PATTERNS:
+            text = pattern.sub(VOLATILE_PLACEHOLDER, text)
+        return text.encode("utf-8")
+
+    @staticmethod
+    def request_key(request: httpx.Request) -> str:
+        body = request.read()
+        content_type = request.headers.get("content-type", "")
+        if content_type.startswith("application/json"):
+            try:
+                body = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False).encode("utf-8")
+            except ValueError:
+                pass
+            body = CassetteStore.normalize_volatile(body)
+        elif content_type.startswith("multipart/form-data") and "boundary=" in content_type:
+            # boundary는 요청마다 무작위라 키에서 제외
+            boundary = content_type.split("boundary=", 1)[1].split(";", 1)[0].strip('"')
+            body = body.replace(boundary.encode("latin-1"), b"BOUNDARY")
+        digest = hashlib.sha256()
+        digest.update(f"{request.method} {request.url.host}{request.url.path}\n".encode("utf-8"))
+        digest.update(body)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def load(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, request: httpx.Request, response: httpx.Response, body: bytes,
+             elapsed_ms: float) -> None:
+        content_type = response.headers.get("content-type", "")
+        # 텍스트(JSON) 응답은 사람이 읽을 수 있게, 음성 등 바이너리는 base64로 저장
+        if content_type.startswith(("application/json", "text/")):
+            encoding, content = "utf-8", body.decode("utf-8")
+        else:
+            encoding, content = "base64", base64.b64encode(body).decode("ascii")
+        request_content_type = request.headers.get("content-type", "")
+        cassette = {
+            "request": {
+                "method": request.method,
+                "url": str(request.url),
+                # 프롬프트 확인용 (multipart 음성 파일은 저장하지 않음)
+                "body": json.loads(request.read()) if request_content_type.startswith("application/json") else None,
+            },
+            "response": {
+                "status_code": response.status_code,
+                "headers": {name: value for name, value in response.headers.items()
+                            if name.lower() not in _HOP_HEADERS},
+                "encoding": encoding,
+                "content": content,
+            },
+            "elapsed_ms": round(elapsed_ms, 1),
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cassette, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+
+class _CountingTransport(httpx.BaseTransport):
+    """모드별 transport 공통 지표"""
+
+    mode = "live"
+
+    def __init__(self, store: Optional[CassetteStore] = None):
+        self.store = store
+        self._lock = threading.Lock()
+        self.counts = {}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {"mode": self.mode, **self.counts}
+        if self.store:
+            stats["cassette_dir"] = self.store.directory
+        return stats
+
+
+class RecordingTransport(_CountingTransport):
+    """실제 API를 호출하고 2xx 응답을 cassette로 저장"""
+
+    mode = "record"
+
+    def __init__(self, inner: httpx.BaseTransport, store: CassetteStore):
+        super().__init__(store)
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.store.request_key(request)
+        started = time.perf_counter()
+        response = self.inner.handle_request(request)
+        try:
+            # 스트림 응답을 끝까지 읽어야 저장 가능 (content-encoding은 해제된 상태)
+            body = response.read()
+        finally:
+            response.close()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if 200 <= response.status_code < 300:
+            try:
+                self.store.save(key, request, response, body, elapsed_ms)
+                self._count("recorded")
+            except Exception as e:
+                # 저장 실패가 API 응답을 막지 않도록
+                self._count("record_errors")
+                print(f"cassette 저장 실패 (계속 진행): {e}")
+        else:
+            self._count("not_recorded")
+
+        headers = [(name, value) for name, value in response.headers.multi_items()
+                   if name.lower() not in _HOP_HEADERS]
+        return httpx.Response(response.status_code, headers=headers, content=body,
+                              extensions=response.extensions)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayTransport(_CountingTransport):
+    """저장된 cassette로 응답 (네트워크 호출 없음)"""
+
+    mode = "replay"
+
+    def __init__(self, store: CassetteStore, latency: str = LLM_REPLAY_LATENCY,
+                 latency_scale: float = LLM_REPLAY_LATENCY_SCALE):
+        super().__init__(store)
+        self.latency = latency
+        self.latency_scale = latency_scale
+
+    def _delay_seconds(self, cassette: dict) -> float:
+        if self.latency == "recorded":
+            milliseconds = float(cassette.get("elapsed_ms", 0))
+        else:
+            milliseconds = float(self.latency)
+        return max(0.0, milliseconds * self.latency_scale / 1000)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = self.store.request_key(request)
+        cassette = self.store.load(key)
+        if cassette is None:
+            self._count("misses")
+            print(f"cassette 없음: {request.method} {request.url.path} (키: {key[:12]})")
+            # 404는 SDK가 재시도하지 않으므로 바로 오류로 드러남
+            return httpx.Response(404, json={
+                "type": "error",
+                "error": {
+                    "type": "cassette_not_found",
+                    "message": f"재생할 cassette가 없습니다 ({request.method} {request.url.path}, 키: {key}). "
+                               f"LLM_PROVIDER_MODE=record로 먼저 기록하세요."
+                }
+            }, request=request)
+
+        self._count("hits")
+        delay = self._delay_seconds(cassette)
+        if delay:
+            time.sleep(delay)
+        recorded = cassette["response"]
+        if recorded["encoding"] == "base64":
+            content = base64.b64decode(recorded["content"])
+        else:
+            content = recorded["content"].encode("utf-8")
+        return httpx.Response(recorded["status_code"], headers=recorded["headers"], content=content,
+                              request=request)
+
+
+# ===== 합성 응답 (fake 모드) =====
+_LETTER_SENTENCES = [
+    "{name}님은 맡은 일을 끝까지 책임지는 태도로 팀 안에서 신뢰를 얻었습니다.",
+    "2023년 3월부터 약 18개월 동안 데이터 분석 프로젝트를 함께 진행하며 가까이에서 지켜보았습니다.",
+    "당시 {name}님은 처리 시간을 40% 단축하는 개선안을 직접 제안하고 구현까지 이끌었습니다.",
+    "문제가 생기면 원인을 끝까지 파고들어 근거를 정리한 뒤 동료들과 공유하는 습관이 있습니다.",
+    "회의에서는 다른 사람의 의견을 먼저 듣고, 합의된 방향을 빠르게 실행으로 옮겼습니다.",
+    "신입 구성원 3명의 온보딩을 맡아 업무 문서를 새로 정리한 일도 기억에 남습니다.",
+    "고객 요청이 몰리던 시기에도 일정과 품질을 함께 지켜 12건의 과제를 기한 내에 마쳤습니다.",
+    "새로운 기술을 배우는 속도가 빠르고, 배운 내용을 팀의 방식에 맞게 적용하는 능력이 뛰어납니다.",
+    "{name}님이 작성한 보고서는 핵심이 분명하고 수치 근거가 충실해 의사결정에 자주 인용되었습니다.",
+    "어려운 피드백도 감정적으로 받아들이지 않고 다음 결과물에 꾸준히 반영했습니다.",
+    "외부 협력사와의 일정 조율에서도 차분하게 쟁점을 정리해 갈등 없이 합의를 이끌어냈습니다.",
+    "작은 일에도 기록을 남기는 습관 덕분에 팀 전체의 업무 인수인계가 수월해졌습니다.",
+]
+_FIELD_PHRASES = {
+    "relationship": ["지도교수", "직속 상사", "같은 팀 동료", "프로젝트 책임자"],
+    "strengths": ["데이터 분석 역량과 꼼꼼한 문서화", "빠른 학습 능력과 문제 해결력", "책임감 있는 일정 관리와 협업 능력"],
+    "memorable": ["처리 시간을 40% 단축한 개선 프로젝트", "교내 공모전 최우수상 수상", "신입 구성원 온보딩 문서 정비"],
+    "additional_info": ["지역 봉사 동아리 2년 활동", "정보처리기사 자격증 보유", ""],
+    "tone": ["격식있는", "친근한"],
+    "sentence_length": ["보통"],
+    "vocabulary_level": ["일상적", "전문적"],
+    "speech_level": ["존댓말"],
+    "subject_style": ["주어 생략", "'저는' 사용"],
+    "sentence_flow": ["연결어 자주 사용", "간결한 표현"],
+    "common_phrases": ["~합니다", "~했습니다", "~입니다", "~하더라고요"],
+    "characteristics": ["구체적인 사례 위주 서술", "문단이 짧고 명확함"],
+}
+_DEFAULT_PHRASES = ["구체적인 사례를 들어 설명했습니다", "전반적으로 무난합니다", "핵심 내용이 잘 드러납니다"]
+_TRANSCRIPTS = [
+    "저는 지도교수로서 학생을 2년 동안 지켜봤고, 연구실 프로젝트에서 데이터 수집을 주도했습니다. 성실하고 꼼꼼한 편입니다.",
+    "같은 팀 동료로 일했는데요, 어려운 일정에서도 끝까지 책임지고 마무리하는 모습이 인상적이었습니다.",
+    "상사로서 말씀드리면 고객 응대 개선안을 직접 제안해서 불만 건수를 절반으로 줄였습니다.",
+]
+_CRITERIA_LABELS = {"accuracy": "정확성", "professionalism": "전문성", "coherence": "논리성",
+                    "personalization": "개인화", "persuasiveness": "설득력"}
+
+# 무음 MP3 프레임 (MPEG-1 Layer III, 128kbps, 44.1kHz, 프레임당 약 26ms)
+_SILENT_MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0x64]) + bytes(413)
+_MP3_FRAME_SECONDS = 1152 / 44100
+
+_JSON_TEMPLATE_PATTERN = re.compile(r"JSON[^\n]*:\s*\n(\{.*?\n\})", re.DOTALL)
+
+
+def _prompt_text(payload: dict) -> str:
+    """Anthropic / OpenAI 요청 본문에서 마지막 사용자 메시지 텍스트"""
+    for message in reversed(payload.get("messages") or []):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content")
+        if isinstance(content, list):
+            return "\n".join(part.get("text", "") for part in content if isinstance(part, dict))
+        return content or ""
+    return ""
+
+
+def _fake_letter(prompt: str, rng: random.Random) -> str:
+    """요청된 글자 수에 맞춘 추천서 형식의 한국어 본문"""
+    target = re.search(r"정확히 (\d+)자", prompt) or re.search(r"최소 (\d+)자", prompt)
+    target_chars = int(target.group(1)) if target else 1000
+    name_match = re.search(r"(\S+?)님을", prompt)
+    name = name_match.group(1) if name_match else "지원자"
+
+    # 목표 글자 수에 닿을 때까지 문장을 이어 붙이고 3~5문장마다 문단을 나눔
+    paragraphs, sentences, body_chars = [], [], 0
+    paragraph_size = rng.randint(3, 5)
+    while body_chars < target_chars:
+        sentence = rng.choice(_LETTER_SENTENCES).format(name=name)
+        sentences.append(sentence)
+        body_chars += len(sentence) + 1
+        if len(sentences) == paragraph_size:
+            paragraphs.append(" ".join(sentences))
+            sentences, paragraph_size = [], rng.randint(3, 5)
+    if sentences:
+        paragraphs.append(" ".join(sentences))
+    closing = f"위와 같은 이유로 {name}님을 적극 추천합니다."
+    return "\n\n".join(["추천서", *paragraphs, closing, datetime.now().strftime("%Y년 %m월 %d일")])
+
+
+def _fake_json_fields(prompt: str, rng: random.Random) -> str:
+    """프롬프트에 제시된 JSON 형식의 키를 그대로 채운 응답"""
+    # "다음 JSON 형식으로 응답해주세요:" 다음 줄부터 "}" 줄까지
+    match = _JSON_TEMPLATE_PATTERN.search(prompt)
+    template = match.group(1) if match else ""
+    fields = {}
+    for key, opener in re.findall(r'"(\w+)"\s*:\s*(\[|")', template):
+        phrases = _FIELD_PHRASES.get(key, _DEFAULT_PHRASES)
+        fields[key] = rng.sample(phrases, min(3, len(phrases))) if opener == "[" else rng.choice(phrases)
+    return json.dumps(fields, ensure_ascii=False, indent=2)
+
+
+def _fake_from_schema(schema: dict, rng: random.Random) -> Any:
+    """JSON 스키마(함수 호출 파라미터)에 맞는 값 생성"""
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        return {key: _fake_from_schema(child, rng) for key, child in (schema.get("properties") or {}).items()}
+    if schema_type == "integer":
+        low, high = schema.get("minimum", 1), schema.get("maximum", 5)
+        # 평가 점수처럼 상한이 작은 정수는 중상위 점수가 많이 나오도록
+        return rng.randint(max(low, high - 2), high) if high - low <= 10 else rng.randint(low, high)
+    if schema_type == "number":
+        return round(rng.uniform(schema.get("minimum", 0), schema.get("maximum", 1)), 2)
+    if schema_type == "boolean":
+        return rng.random() < 0.5
+    if schema_type == "array":
+        return [_fake_from_schema(schema.get("items") or {"type": "string"}, rng) for _ in range(2)]
+    return rng.choice(_DEFAULT_PHRASES)
+
+
+def _fake_score_lines(rng: random.Random) -> str:
+    """함수 호출 없이 요청된 평가의 점수 줄 형식 ("정확성: 4점 - 이유")"""
+    return "\n".join(f"{label}: {rng.randint(3, 5)}점 - {rng.choice(_DEFAULT_PHRASES)}"
+                     for label in _CRITERIA_LABELS.values())
+
+
+def _fake_text(prompt: str, rng: random.Random) -> str:
+    if _JSON_TEMPLATE_PATTERN.search(prompt):
+        return _fake_json_fields(prompt, rng)
+    return _fake_letter(prompt, rng)
+
+
+class FakeProviderTransport(_CountingTransport):
+    """
+    외부 API 없이 요청 형식에 맞는 합성 응답 (Anthropic Messages / OpenAI Chat · Whisper · TTS)
+    - 응답 본문은 요청 해시로 결정 (같은 요청 → 같은 응답)
+    - 지연 / 429 / 529 / 500은 시드 고정 난수로 주입
+    """
+
+    mode = "fake"
+
+    def __init__(self, seed: int = LLM_FAKE_SEED):
+        super().__init__()
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self.latencies_ms = []
+
+    def _draw(self) -> tuple:
+        with self._lock:
+            return self._rng.random(), self._rng.gauss(0, 1)
+
+    def _latency_seconds(self, normal: float, output_chars: int) -> float:
+        base = LLM_FAKE_LATENCY_MS * math.exp(LLM_FAKE_LATENCY_SIGMA * normal)
+        return (base + LLM_FAKE_LATENCY_MS_PER_1K_CHARS * output_chars / 1000) / 1000
+
+    def _error_response(self, request: httpx.Request, status_code: int, error_type: str, message: str) -> httpx.Response:
+        self._count(f"injected_{status_code}")
+        headers = {"retry-after": LLM_FAKE_RETRY_AFTER_SECONDS} if status_code == 429 else {}
+        return httpx.Response(status_code, headers=headers, request=request, json={
+            "type": "error", "error": {"type": error_type, "message": f"[fake] {message}"}
+        })
+
+    def _injected_error(self, request: httpx.Request, draw: float) -> Optional[httpx.Response]:
+        threshold = LLM_FAKE_RATE_LIMIT_RATE
+        if draw < threshold:
+            return self._error_response(request, 429, "rate_limit_error", "Rate limit exceeded")
+        threshold += LLM_FAKE_OVERLOAD_RATE
+        if draw < threshold:
+            # Anthropic은 529 overloaded, OpenAI는 503
+            if "anthropic" in request.url.host or request.url.path.endswith("/messages"):
+                return self._error_response(request, 529, "overloaded_error", "Overloaded")
+            return self._error_response(request, 503, "service_unavailable", "Service unavailable")
+        threshold += LLM_FAKE_ERROR_RATE
+        if draw < threshold:
+            return self._error_response(request, 500, "api_error", "Internal server error")
+        return None
+
+    def _respond(self, request: httpx.Request, rng: random.Random) -> tuple:
+        """(응답, 출력 글자 수)"""
+        path = request.url.path
+        if path.endswith("/audio/speech"):
+            text = json.loads(request.read()).get("input", "")
+            # 한국어 낭독 속도 약 초당 7자
+            frames = max(1, math.ceil(len(text) / 7 / _MP3_FRAME_SECONDS))
+            return httpx.Response(200, headers={"content-type": "audio/mpeg"}, content=_SILENT_MP3_FRAME * frames,
+                                  request=request), len(text)
+        if path.endswith("/audio/transcriptions"):
+            transcript = rng.choice(_TRANSCRIPTS)
+            return httpx.Response(200, json={"text": transcript}, request=request), len(transcript)
+
+        payload = json.loads(request.read() or b"{}")
+        prompt = _prompt_text(payload)
+        model = payload.get("model", "fake")
+        if path.endswith("/chat/completions"):
+            tools = payload.get("tools") or []
+            if tools:
+                function = tools[0]["function"]
+                arguments = json.dumps(_fake_from_schema(function.get("parameters") or {}, rng), ensure_ascii=False)
+                message = {"role": "assistant", "content": None, "tool_calls": [{
+                    "id": f"call_{rng.getrandbits(48):012x}", "type": "function",
+                    "function": {"name": function["name"], "arguments": arguments}
+                }]}
+                finish_reason, output = "tool_calls", arguments
+            else:
+                output = _fake_score_lines(rng) if "점수" in prompt else _fake_text(prompt, rng)
+                message = {"role": "assistant", "content": output}
+                finish_reason = "stop"
+            return httpx.Response(200, request=request, json={
+                "id": f"chatcmpl-fake-{rng.getrandbits(48):012x}", "object": "chat.completion",
+                "created": int(time.time()), "model": model,
+                "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                "usage": {"prompt_tokens": len(prompt) // 2, "completion_tokens": len(output) // 2,
+                          "total_tokens": (len(prompt) + len(output)) // 2},
+            }), len(output)
+        if path.endswith("/messages"):
+            output = _fake_text(prompt, rng)
+            return httpx.Response(200, request=request, json={
+                "id": f"msg_fake_{rng.getrandbits(48):012x}", "type": "message", "role": "assistant",
+                "model": model, "content": [{"type": "text", "text": output}],
+                "stop_reason": "end_turn", "stop_sequence": None,
+                "usage": {"input_tokens": len(prompt) // 2, "output_tokens": len(output) // 2},
+            }), len(output)
+        return self._error_response(request, 404, "not_found_error", f"지원하지 않는 경로: {path}"), 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._count("requests")
+        draw, normal = self._draw()
+        error = self._injected_error(request, draw)
+        if error is not None:
+            # 오류 응답은 빠르게 (정상 지연의 10%)
+            time.sleep(self._latency_seconds(normal, 0) * 0.1)
+            return error
+
+        key = CassetteStore.request_key(request)
+        rng = random.Random(f"{self.seed}:{key}")
+        response, output_chars = self._respond(request, rng)
+        delay = self._latency_seconds(normal, output_chars)
+        with self._lock:
+            self.latencies_ms.append(delay * 1000)
+            # 최근 1000건만 유지 (지표용)
+            del self.latencies_ms[:-1000]
+        time.sleep(delay)
+        return response
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            latencies = sorted(self.latencies_ms)
+        if latencies:
+            stats["latency_ms_p50"] = round(latencies[len(latencies) // 2], 1)
+            stats["latency_ms_p95"] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1)
+        return stats
+
+
+class _ThreadedAsyncTransport(httpx.AsyncBaseTransport):
+    """기록 / 재생 / 합성 transport(동기)를 비동기 클라이언트에서 사용 (스레드에서 실행, 지표 공유)"""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        response = await asyncio.to_thread(self.transport.handle_request, request)
+        body = await asyncio.to_thread(response.read)
+        return httpx.Response(response.status_code, headers=response.headers, content=body,
+                              extensions=response.extensions, request=request)
+
+
+def build_async_transport(network: httpx.AsyncBaseTransport, transport: httpx.BaseTransport) -> httpx.AsyncBaseTransport:
+    """live면 비동기 네트워크 transport, 그 외 모드는 동기 transport(build_transport 결과)를 스레드로 감싸 사용"""
+    if LLM_PROVIDER_MODE == "live":
+        return network
+    return _ThreadedAsyncTransport(transport)
+
+
+def build_transport(network: httpx.BaseTransport) -> httpx.BaseTransport:
+    """LLM_PROVIDER_MODE에 맞는 transport (live면 실제 네트워크 transport 그대로)"""
+    if LLM_PROVIDER_MODE == "record":
+        print(f"🎞️  LLM 호출 기록 모드 (cassette: {LLM_CASSETTE_DIR})")
+        return RecordingTransport(network, CassetteStore())
+    if LLM_PROVIDER_MODE == "replay":
+        print(f"🎞️  LLM 호출 재생 모드 (cassette: {LLM_CASSETTE_DIR}, 지연: {LLM_REPLAY_LATENCY} × {LLM_REPLAY_LATENCY_SCALE})")
+        return ReplayTransport(CassetteStore())
+    if LLM_PROVIDER_MODE == "fake":
+        print(f"🧪 LLM 합성 응답 모드 (지연 중앙값 {LLM_FAKE_LATENCY_MS:.0f}ms, 429 {LLM_FAKE_RATE_LIMIT_RATE:.0%} / "
+              f"과부하 {LLM_FAKE_OVERLOAD_RATE:.0%} / 500 {LLM_FAKE_ERROR_RATE:.0%}, 시드 {LLM_FAKE_SEED})")
+        return FakeProviderTransport()
+    return network
@@ -1209,6 +1209,7 @@ export default function App() {
   const [evaluationScores, setEvaluationScores] = useState(null);
   const [evaluationImprovements, setEvaluationImprovements] = useState([]);
   const [evaluating, setEvaluating] = useState(false);
+  const [evaluationProvisional, setEvaluationProvisional] = useState(false);  // 휴리스틱 예비 점수 여부
   
   // 버전 관리 (되돌리기용)
   const [previousVersion, setPreviousVersion] = useState(null);
@@ -1676,16 +1677,20 @@ export default function App() {
   };
 
   // 추천서 평가 함수
-  const evaluateRecommendation = async (recommendationText) => {
+  const evaluateRecommendation = async (recommendationText, fullEvaluation = false) => {
     setEvaluating(true);
     setEvaluationScores(null);
     setEvaluationImprovements([]);
+    setEvaluationProvisional(false);
     try {
       const data = await apiPost("/evaluate-recommendation", {
-        recommendation_text: recommendationText
+        recommendation_text: recommendationText,
+        recommendation_id: currentRecommendationId || null,
+        full_evaluation: fullEvaluation
       });
       setEvaluationScores(data.scores);
       setEvaluationImprovements(data.improvements || []);
+      setEvaluationProvisional(!!data.provisional);
       console.log("평가 완료:", data);
     } catch (err) {
       console.error("추천서 평가 에러:", err);
@@ -1705,6 +1710,7 @@ export default function App() {
     setShowPreview(false);
     setEvaluationScores(null);
     setEvaluationImprovements([]);
+    setEvaluationProvisional(false);
     setPreviousVersion(null);
     setChangedSections([]);
     try {
@@ -1726,6 +1732,7 @@ export default function App() {
         signature_data: signatureData || null,
         signature_type: signatureType || null,
         use_writing_style: !!writingStyleAnalysis,  // 문체 분석이 있을 때만 문체 사용
+        auto_evaluate: true,  // 저장 직후 서버에서 품질 평가를 미리 실행
       });
       setRecommendation(data.recommendation);
       setEditedRecommendation(data.recommendation);
@@ -1969,14 +1976,46 @@ export default function App() {
         throw new Error(errorMsg);
       }
 
-      const audioBlob = await response.blob();
-      const elapsedTime = ((Date.now() - startTime) / 1000).toFixed(1);
-      console.log(`✅ 음성 생성 완료 (${elapsedTime}초, ${audioBlob.size} bytes)`);
+      // 긴 추천서는 서버가 청크 단위로 스트리밍하므로, 지원되는 브라우저에서는 받는 즉시 재생
+      let audioUrl;
+      const canStream = response.body && window.MediaSource && MediaSource.isTypeSupported('audio/mpeg');
+      if (canStream) {
+        const mediaSource = new MediaSource();
+        audioUrl = URL.createObjectURL(mediaSource);
+        mediaSource.addEventListener('sourceopen', async () => {
+          const sourceBuffer = mediaSource.addSourceBuffer('audio/mpeg');
+          sourceBuffer.mode = 'sequence'; // 청크마다 타임스탬프가 0부터 시작하므로 이어 붙임
+          const reader = response.body.getReader();
+          let received = 0;
+          try {
+            while (true) {
+              const { done, value } = await reader.read();
+              if (done) break;
+              received += value.byteLength;
+              await new Promise((resolve, reject) => {
+                sourceBuffer.addEventListener('updateend', resolve, { once: true });
+                sourceBuffer.addEventListener('error', reject, { once: true });
+                sourceBuffer.appendBuffer(value);
+              });
+            }
+            if (mediaSource.readyState === 'open') mediaSource.endOfStream();
+            const elapsedTime = ((Date.now() - startTime) / 1000).toFixed(1);
+            console.log(`✅ 음성 수신 완료 (${elapsedTime}초, ${received} bytes)`);
+          } catch (e) {
+            console.error('❌ 음성 스트리밍 오류:', e);
+            if (mediaSource.readyState === 'open') mediaSource.endOfStream('network');
+          }
+        }, { once: true });
+      } else {
+        const audioBlob = await response.blob();
+        const elapsedTime = ((Date.now() - startTime) / 1000).toFixed(1);
+        console.log(`✅ 음성 생성 완료 (${elapsedTime}초, ${audioBlob.size} bytes)`);
+        audioUrl = URL.createObjectURL(audioBlob);
+      }
       
       setIsGeneratingAudio(false);
       setIsReading(true);
       
-      const audioUrl = URL.createObjectURL(audioBlob);
       const audio = new Audio(audioUrl);
       audioRef.current = audio;
 
@@ -4013,6 +4052,20 @@ export default function App() {
                             <div style={{ fontSize: "1.25rem", color: "#7c3aed", fontWeight: 600 }}>
                               평균 점수: {(Object.values(evaluationScores).reduce((a, b) => a + b, 0) / Object.values(evaluationScores).length).toFixed(1)}/5
                             </div>
+                            {evaluationProvisional && (
+                              <div style={{ marginTop: "0.75rem" }}>
+                                <div style={{ fontSize: "0.875rem", color: "#6b7280", marginBottom: "0.5rem" }}>
+                                  분량·구체성·문단 구조 등으로 계산한 빠른 예비 점수입니다.
+                                </div>
+                                <button
+                                  type="button"
+                                  onClick={() => evaluateRecommendation(editedRecommendation, true)}
+                                  style={{ padding: "8px 20px", fontSize: "0.875rem", fontWeight: "600", color: "white", background: "#7c3aed", border: "none", borderRadius: "8px", cursor: "pointer" }}
+                                >
+                                  🔍 AI 정밀 평가하기
+                                </button>
+                              </div>
+                            )}
                           </div>
                         </div>
                         
@@ -11,6 +11,7 @@ const TRANSLATIONS = {
     success: '✅ 음성 입력이 완료되었습니다!\n\n각 항목을 확인하고 필요시 수정해주세요.',
     errorUpload: '음성 처리 중 오류가 발생했습니다.\n\n',
     errorServer: '\n\n서버 상태를 확인해주세요.',
+    listening: '듣는 중: ',
   },
   en: {
     voiceInput: '🎤 Voice Input',
@@ -21,19 +22,141 @@ const TRANSLATIONS = {
     success: '✅ Voice input complete!\n\nPlease review and modify each field if necessary.',
     errorUpload: 'An error occurred during voice processing.\n\n',
     errorServer: '\n\nPlease check the server status.',
+    listening: 'Heard so far: ',
   },
 };
 
+// 녹음 중 일정 간격으로 구간을 나눠 서버로 보내고, 서버는 구간별로 바로 텍스트 변환
+const SEGMENT_MS = 8000;
+const TIMESLICE_MS = 1000;
+const WS_CONNECT_TIMEOUT_MS = 3000;
+
+// /ws/voice-input 주소 (API 주소가 상대 경로면 현재 호스트 기준)
+const buildWsUrl = (endpoint) => {
+  const url = buildApiUrl(endpoint);
+  if (url.startsWith('http')) {
+    return url.replace(/^http/, 'ws');
+  }
+  const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+  return `${protocol}//${window.location.host}${url}`;
+};
+
+// WebSocket 연결 (실패하거나 시간 초과면 null → 기존 업로드 방식 사용)
+const openVoiceSocket = () =>
+  new Promise((resolve) => {
+    let ws;
+    try {
+      ws = new WebSocket(buildWsUrl('/ws/voice-input'));
+    } catch (e) {
+      resolve(null);
+      return;
+    }
+    const timer = setTimeout(() => {
+      ws.close();
+      resolve(null);
+    }, WS_CONNECT_TIMEOUT_MS);
+    ws.onopen = () => {
+      clearTimeout(timer);
+      resolve(ws);
+    };
+    ws.onerror = () => {
+      clearTimeout(timer);
+      resolve(null);
+    };
+  });
+
 /**
  * 음성 입력 버튼 컴포넌트
  * 사용자의 음성을 녹음하고, 서버에서 텍스트로 변환 후 필드별로 분류
+ * - WebSocket 사용 가능: 녹음 중 구간별로 전송해 바로 변환 (녹음 종료 후 대기 시간 단축)
+ * - 사용 불가: 녹음 완료 후 파일 업로드 (/parse-voice-input)
  */
 function VoiceInputButton({ onFieldsReceived, language = 'ko' }) {
   const t = TRANSLATIONS[language] || TRANSLATIONS.ko;
   const [isRecording, setIsRecording] = useState(false);
   const [isProcessing, setIsProcessing] = useState(false);
+  const [partialTranscript, setPartialTranscript] = useState('');
   const mediaRecorderRef = useRef(null);
   const audioChunksRef = useRef([]);
+  const wsRef = useRef(null);
+  const recordingRef = useRef(false);
+  const segmentTimerRef = useRef(null);
+
+  /**
+   * 서버 처리 완료 (결과 또는 오류) 후 정리
+   */
+  const finishStreaming = () => {
+    if (wsRef.current && wsRef.current.readyState <= WebSocket.OPEN) {
+      wsRef.current.close();
+    }
+    wsRef.current = null;
+    setIsProcessing(false);
+    setPartialTranscript('');
+  };
+
+  const handleSocketMessage = (event) => {
+    const message = JSON.parse(event.data);
+    if (message.type === 'partial') {
+      setPartialTranscript(message.transcript);
+    } else if (message.type === 'result') {
+      console.log('✅ 변환된 텍스트:', message.transcribed_text);
+      console.log('✅ 분류된 필드:', message.fields);
+      finishStreaming();
+      if (onFieldsReceived) {
+        onFieldsReceived(message.fields, message.transcribed_text);
+      }
+      alert(t.success);
+    } else if (message.type === 'error') {
+      console.error('❌ 실시간 음성 입력 오류:', message.detail);
+      recordingRef.current = false;
+      clearTimeout(segmentTimerRef.current);
+      if (mediaRecorderRef.current && mediaRecorderRef.current.state === 'recording') {
+        mediaRecorderRef.current.stop();
+      }
+      setIsRecording(false);
+      finishStreaming();
+      alert(`${t.errorUpload}${message.detail}${t.errorServer}`);
+    }
+  };
+
+  /**
+   * 구간 녹음 시작 (구간마다 새 MediaRecorder → 각 구간이 단독으로 재생 가능한 파일)
+   */
+  const startSegment = (stream, ws, isFirst = false) => {
+    const recorder = new MediaRecorder(stream);
+    mediaRecorderRef.current = recorder;
+
+    recorder.ondataavailable = (event) => {
+      if (event.data.size > 0 && ws.readyState === WebSocket.OPEN) {
+        ws.send(event.data);
+      }
+    };
+
+    recorder.onstop = () => {
+      if (ws.readyState !== WebSocket.OPEN) {
+        stream.getTracks().forEach(track => track.stop());
+        return;
+      }
+      ws.send(JSON.stringify({ type: 'segment_end' }));
+      if (recordingRef.current) {
+        startSegment(stream, ws);
+      } else {
+        ws.send(JSON.stringify({ type: 'stop' }));
+        stream.getTracks().forEach(track => track.stop());
+      }
+    };
+
+    recorder.start(TIMESLICE_MS);
+    if (isFirst) {
+      // 브라우저마다 녹음 형식이 다름 (Chrome: webm, Safari: mp4)
+      ws.send(JSON.stringify({ type: 'start', mime_type: recorder.mimeType || 'audio/webm' }));
+    }
+    segmentTimerRef.current = setTimeout(() => {
+      if (recorder.state === 'recording') {
+        recorder.stop();
+      }
+    }, SEGMENT_MS);
+  };
 
   /**
    * 녹음 시작
@@ -42,6 +165,24 @@ function VoiceInputButton({ onFieldsReceived, language = 'ko' }) {
     try {
       // 마이크 권한 요청
       const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+
+      const ws = await openVoiceSocket();
+      if (ws) {
+        wsRef.current = ws;
+        ws.onmessage = handleSocketMessage;
+        ws.onclose = () => {
+          if (wsRef.current === ws) {
+            finishStreaming();
+          }
+        };
+        recordingRef.current = true;
+        setPartialTranscript('');
+        startSegment(stream, ws, true);
+        setIsRecording(true);
+        console.log('녹음 시작 (실시간 변환)');
+        return;
+      }
+
       const mediaRecorder = new MediaRecorder(stream);
       mediaRecorderRef.current = mediaRecorder;
       audioChunksRef.current = [];
@@ -75,6 +216,18 @@ function VoiceInputButton({ onFieldsReceived, language = 'ko' }) {
    * 녹음 중지
    */
   const stopRecording = () => {
+    if (wsRef.current && isRecording) {
+      // 마지막 구간을 마무리하면 onstop에서 stop 메시지 전송
+      recordingRef.current = false;
+      clearTimeout(segmentTimerRef.current);
+      setIsRecording(false);
+      setIsProcessing(true);
+      if (mediaRecorderRef.current && mediaRecorderRef.current.state === 'recording') {
+        mediaRecorderRef.current.stop();
+      }
+      console.log('녹음 중지 (남은 구간 변환 후 필드 분류)');
+      return;
+    }
     if (mediaRecorderRef.current && isRecording) {
       mediaRecorderRef.current.stop();
       setIsRecording(false);
@@ -208,6 +361,18 @@ function VoiceInputButton({ onFieldsReceived, language = 'ko' }) {
         </button>
       )}
 
+      {partialTranscript && (
+        <div style={{
+          marginTop: '8px',
+          maxWidth: '420px',
+          fontSize: '13px',
+          color: '#555',
+          lineHeight: 1.5
+        }}>
+          {t.listening}{partialTranscript}
+        </div>
+      )}
+
       {/* CSS 애니메이션 */}
       <style>{`
         @keyframes pulse {
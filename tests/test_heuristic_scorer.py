@@ -0,0 +1,80 @@
+"""휴리스틱 예비 평가 (heuristic_evaluate): 점수 범위와 경계 구간 판정"""
+import pytest
+
+from evals.evaluators.heuristic_scorer import BORDERLINE_RANGE, CRITERIA, heuristic_evaluate
+
+# 분량이 목표보다 훨씬 짧고 누구에게나 쓸 수 있는 표현뿐인 초안
+GENERIC_DRAFT = (
+    "김민수 학생은 제가 2년 동안 가르친 학생입니다. 수업 시간에 항상 성실한 태도로 참여했고 과제도 빠짐없이 제출했습니다. "
+    "조별 과제에서는 팀장을 맡아 친구들을 잘 이끌었습니다. 그는 책임감이 강하고 맡은 일을 끝까지 해내는 학생입니다.\n\n"
+    "또한 동아리 활동에서도 적극적으로 활동하며 좋은 평가를 받았습니다. 어려운 문제를 만나도 포기하지 않고 해결 방법을 찾았습니다.\n\n"
+    "이 학생을 자신 있게 추천합니다. 좋은 결과가 있기를 바랍니다."
+)
+
+# 분량/구체적 사례/문단 구성/추천 의사를 갖춘 추천서
+WELL_FORMED = """저는 2021년 3월부터 2023년 2월까지 한국대학교 컴퓨터공학과에서 김민수 학생의 지도교수로 일했습니다. 그동안 학생은 제 연구실에서 두 개의 프로젝트에 참여했고, 저는 가까이에서 그의 작업을 지켜볼 수 있었습니다.
+
+첫 번째 프로젝트는 교내 도서관 좌석 예약 시스템 개선이었습니다. 김민수 학생은 대기 시간을 줄이기 위해 예약 알고리즘을 다시 설계했고, 평균 대기 시간이 12분에서 4분으로 줄었습니다. 이 결과는 2022년 6월 학과 세미나에서 발표되었으며, 참석한 교수 8명 중 6명이 다음 학기 수업 자료로 활용하겠다고 했습니다.
+
+두 번째 프로젝트에서는 팀원 5명과 함께 의료 영상 분류 모델을 만들었습니다. 학생은 데이터 전처리를 맡아 3만 장의 영상을 정리했고, 라벨 오류를 찾아내는 스크립트를 직접 작성했습니다. 덕분에 모델 정확도가 81%에서 89%로 올랐고, 팀은 2022년 11월 교내 경진대회에서 2위를 했습니다. 마감 직전 서버 장애가 났을 때도 그는 밤새 복구 작업을 주도하며 팀을 차분하게 이끌었습니다.
+
+수업에서도 학생의 태도는 인상적이었습니다. 제 자료구조 수업에서 120명 중 3등을 했고, 질문 게시판에 올라온 다른 학생들의 질문 40여 건에 자세한 답을 달아 주었습니다. 그는 모르는 것을 부끄러워하지 않고 묻되, 답을 들은 뒤에는 스스로 더 깊이 파고드는 학생입니다.
+
+연구실 밖에서도 그는 후배 4명의 졸업 프로젝트를 매주 2시간씩 도왔고, 그중 3명이 학과 우수 작품으로 선정되었습니다. 저는 이 과정에서 그가 다른 사람의 성장을 자기 일처럼 기뻐하는 모습을 여러 번 보았습니다.
+
+이러한 경험을 바탕으로 김민수 학생이 귀 기관의 대학원 과정에서도 좋은 성과를 낼 것이라고 확신합니다. 저는 김민수 학생을 귀 프로그램에 추천합니다."""
+
+
+def assert_scores_in_range(result):
+    assert set(result["scores"]) == set(CRITERIA)
+    assert all(isinstance(score, int) and 1 <= score <= 5 for score in result["scores"].values())
+    assert 0.0 <= result["percentage"] <= 100.0
+
+
+def test_empty_text_scores_minimum_and_is_not_borderline():
+    result = heuristic_evaluate("")
+    assert_scores_in_range(result)
+    assert set(result["scores"].values()) == {1}
+    assert result["percentage"] == 0.0
+    assert result["borderline"] is False
+
+
+def test_short_generic_draft_is_never_a_confident_high_score():
+    result = heuristic_evaluate(GENERIC_DRAFT)
+    assert_scores_in_range(result)
+    assert result["features"]["length_fit"] < 0.5
+    # 분량 미달은 관련 기준 상한(3점)으로 제한
+    for key in ("coherence", "personalization", "persuasiveness"):
+        assert result["scores"][key] <= 3
+    assert result["percentage"] < 60.0
+    # 확정 응답이면 분명히 낮은 점수여야 하고, 그렇지 않으면 GPT 정밀 평가 대상
+    assert result["borderline"] or result["percentage"] < BORDERLINE_RANGE[0]
+    # 약점 설명은 5점 미만 기준에만
+    assert "분량" in result["reasons"]["personalization"]
+
+
+def test_missing_recommend_intent_caps_persuasiveness_and_needs_review():
+    text = WELL_FORMED.replace("저는 김민수 학생을 귀 프로그램에 추천합니다.", "감사합니다.")
+    result = heuristic_evaluate(text)
+    assert result["features"]["recommend_intent"] == 0.0
+    assert result["scores"]["persuasiveness"] <= 2
+    assert "추천 문장" in result["reasons"]["persuasiveness"]
+    assert result["borderline"] is True
+
+
+def test_well_formed_letter_scores_high_without_review():
+    result = heuristic_evaluate(WELL_FORMED)
+    assert_scores_in_range(result)
+    assert all(score >= 4 for score in result["scores"].values())
+    assert result["percentage"] > BORDERLINE_RANGE[1]
+    assert result["borderline"] is False
+
+
+@pytest.mark.parametrize("text", ["", GENERIC_DRAFT, WELL_FORMED])
+def test_reasons_only_name_weaknesses_below_five(text):
+    result = heuristic_evaluate(text)
+    for key, score in result["scores"].items():
+        if score == 5:
+            assert "특이한 약점 없음" in result["reasons"][key]
+        else:
+            assert "특이한 약점 없음" not in result["reasons"][key]
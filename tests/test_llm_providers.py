@@ -0,0 +1,27 @@
+"""CassetteStore.request_key: 같은 요청은 날짜가 달라도 같은 cassette 키"""
+import json
+
+import httpx
+
+from llm_providers import CassetteStore
+
+
+def chat_request(prompt, **extra):
+    payload = {"model": "claude", "messages": [{"role": "user", "content": prompt}], **extra}
+    return httpx.Request("POST", "https://api.anthropic.com/v1/messages",
+                         content=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+                         headers={"content-type": "application/json"})
+
+
+def test_prompt_date_does_not_change_key():
+    recorded = chat_request("작성일: 2025년 11월 26일\n추천서를 작성해주세요.")
+    replayed = chat_request("작성일: 2026년 01월 03일\n추천서를 작성해주세요.")
+    assert CassetteStore.request_key(recorded) == CassetteStore.request_key(replayed)
+
+
+def test_key_ignores_json_key_order_but_not_content():
+    base = CassetteStore.request_key(chat_request("추천서를 작성해주세요.", max_tokens=100))
+    reordered = httpx.Request("POST", "https://api.anthropic.com/v1/messages", json={
+        "max_tokens": 100, "messages": [{"role": "user", "content": "추천서를 작성해주세요."}], "model": "claude"})
+    assert CassetteStore.request_key(reordered) == base
+    assert CassetteStore.request_key(chat_request("자기소개서를 작성해주세요.", max_tokens=100)) != base
@@ -0,0 +1,103 @@
+"""RecoEvaluator 평가 응답 스키마 검증 (parse_structured_response / ScoreSchemaError)"""
+import json
+
+import pytest
+
+from evals.evaluators.reco_evaluator import RecoEvaluator, ScoreSchemaError
+
+CRITERIA = ["accuracy", "professionalism", "coherence", "personalization", "persuasiveness"]
+
+
+def valid_payload():
+    return {key: {"score": score, "reason": f"{key} 이유"} for key, score in zip(CRITERIA, [4, 3, 5, 2, 4])}
+
+
+@pytest.fixture
+def evaluator(tmp_path):
+    return RecoEvaluator(output_dir=str(tmp_path))
+
+
+def test_valid_object(evaluator):
+    scores, reasons = evaluator.parse_structured_response(json.dumps(valid_payload()))
+    assert scores == {"accuracy": 4, "professionalism": 3, "coherence": 5, "personalization": 2, "persuasiveness": 4}
+    assert reasons["coherence"] == "coherence 이유"
+
+
+def test_valid_object_inside_code_block(evaluator):
+    response = "```json\n" + json.dumps(valid_payload(), ensure_ascii=False) + "\n```"
+    scores, _ = evaluator.parse_structured_response(response)
+    assert scores["accuracy"] == 4
+
+
+def test_missing_criterion(evaluator):
+    payload = valid_payload()
+    del payload["persuasiveness"]
+    with pytest.raises(ScoreSchemaError, match="누락"):
+        evaluator.parse_structured_response(json.dumps(payload))
+
+
+def test_extra_key(evaluator):
+    payload = valid_payload()
+    payload["overall"] = {"score": 5, "reason": "추가 항목"}
+    with pytest.raises(ScoreSchemaError, match="추가"):
+        evaluator.parse_structured_response(json.dumps(payload))
+
+
+def test_extra_key_inside_criterion(evaluator):
+    payload = valid_payload()
+    payload["accuracy"]["confidence"] = 0.9
+    with pytest.raises(ScoreSchemaError):
+        evaluator.parse_structured_response(json.dumps(payload))
+
+
+@pytest.mark.parametrize("score", [0, 6, -1, 3.5, "4", True, None])
+def test_score_out_of_range_or_not_integer(evaluator, score):
+    payload = valid_payload()
+    payload["coherence"]["score"] = score
+    with pytest.raises(ScoreSchemaError, match="coherence"):
+        evaluator.parse_structured_response(json.dumps(payload))
+
+
+@pytest.mark.parametrize("reason", ["", "   ", None])
+def test_empty_reason(evaluator, reason):
+    payload = valid_payload()
+    payload["personalization"]["reason"] = reason
+    with pytest.raises(ScoreSchemaError, match="이유가 비어"):
+        evaluator.parse_structured_response(json.dumps(payload))
+
+
+@pytest.mark.parametrize("response", ["", "정확성: 4점 - 좋음", "{accuracy: 4", "[1, 2, 3]", None])
+def test_non_json(evaluator, response):
+    with pytest.raises(ScoreSchemaError):
+        evaluator.parse_structured_response(response)
+
+
+def test_schema_violation_then_valid_response_is_retried(evaluator, monkeypatch):
+    invalid = valid_payload()
+    invalid["accuracy"]["score"] = 7
+    responses = [json.dumps(invalid), json.dumps(valid_payload())]
+    prompts = []
+
+    def fake_call(prompt, deadline=None):
+        prompts.append(prompt)
+        return responses.pop(0)
+
+    monkeypatch.setattr(evaluator, "call_gpt_model", fake_call)
+    result = evaluator.evaluate_single_recommendation({"id": 1, "text": "추천서 본문"})
+
+    assert result["scores"]["accuracy"] == 4
+    assert result["percentage"] == evaluator.calculate_percentage(result["scores"])
+    assert len(prompts) == 2
+    assert "형식 오류" in prompts[1]
+    stats = evaluator.parse_stats()
+    assert stats["responses"] == 2
+    assert stats["schema_violations"] == 1
+    assert stats["failed_items"] == 0
+
+
+def test_schema_violation_on_every_attempt_raises(evaluator, monkeypatch):
+    monkeypatch.setattr(evaluator, "call_gpt_model", lambda prompt, deadline=None: "형식 없는 응답")
+    with pytest.raises(ScoreSchemaError):
+        evaluator.evaluate_single_recommendation({"id": 1, "text": "추천서 본문"})
+    assert evaluator.parse_stats()["schema_violations"] == RecoEvaluator.SCHEMA_RETRIES + 1
+    assert evaluator.parse_stats()["failed_items"] == 1
@@ -0,0 +1,56 @@
+"""RecoEvaluator 항목별 시간 제한: 재시도/대기를 포함해 item_timeout 안에서 끝나야 함"""
+import json
+import time
+
+import httpx
+import pytest
+from openai import OpenAI
+
+from evals.evaluators.reco_evaluator import RecoEvaluator
+
+
+def make_evaluator(tmp_path, handler, item_timeout):
+    requests = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request)
+
+    client = OpenAI(api_key="sk-test", base_url="http://openai.test/v1",
+                    http_client=httpx.Client(transport=httpx.MockTransport(record)))
+    evaluator = RecoEvaluator(output_dir=str(tmp_path), client=client, item_timeout=item_timeout)
+    return evaluator, requests
+
+
+def test_rate_limit_wait_past_deadline_is_not_retried(tmp_path):
+    evaluator, requests = make_evaluator(
+        tmp_path, lambda request: httpx.Response(429, headers={"retry-after": "30"}, json={"error": {}}), 1.0)
+    started = time.monotonic()
+    assert evaluator.call_gpt_model("프롬프트") == ""
+    assert time.monotonic() - started < 1.0
+    # SDK 자체 재시도 없이 1번만 요청
+    assert len(requests) == 1
+
+
+def test_server_errors_stop_at_item_deadline(tmp_path):
+    evaluator, requests = make_evaluator(tmp_path, lambda request: httpx.Response(500, json={"error": {}}), 1.5)
+    started = time.monotonic()
+    assert evaluator.call_gpt_model("프롬프트") == ""
+    assert time.monotonic() - started < 2.0
+    assert 1 < len(requests) <= RecoEvaluator.RATE_LIMIT_RETRIES + 1
+
+
+def test_schema_retries_share_one_deadline(tmp_path, monkeypatch):
+    evaluator, _ = make_evaluator(tmp_path, lambda request: httpx.Response(500), 5.0)
+    deadlines = []
+
+    def fake_call(prompt, deadline=None):
+        deadlines.append(deadline)
+        return json.dumps({"accuracy": 3})
+
+    monkeypatch.setattr(evaluator, "call_gpt_model", fake_call)
+    with pytest.raises(ValueError):
+        evaluator.evaluate_single_recommendation({"id": 1, "text": "추천서 본문"})
+    assert len(deadlines) == RecoEvaluator.SCHEMA_RETRIES + 1
+    assert len(set(deadlines)) == 1
+    assert deadlines[0] <= time.monotonic() + 5.0
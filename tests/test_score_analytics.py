@@ -0,0 +1,37 @@
+"""평가 점수 분석 (summarize): 점수가 빠진 행이 섞여도 집계"""
+import numpy as np
+
+from evals.evaluators.score_analytics import VALUE_COLUMNS, summarize
+
+
+def make_arrays(values):
+    count = len(values)
+    return {
+        "recommender_id": np.arange(count, dtype=np.int64) % 2,
+        "recommender_name": np.array(["a", "b"] * count, dtype=object)[:count],
+        "template_id": np.full(count, -1, dtype=np.int64),
+        "tone": np.array(["formal"] * count),
+        "created_at": np.array(["2025-11-01T00:00:00"] * count, dtype="datetime64[s]"),
+        "values": np.array(values, dtype=float).reshape(-1, len(VALUE_COLUMNS)),
+    }
+
+
+def test_summarize_counts_and_means():
+    summary = summarize(make_arrays([[4, 3, 5, 2, 4, 65.0], [5, 5, 5, 5, 5, 100.0]]), group_by="tone")
+    assert summary["total"] == 2
+    assert summary["overall"]["mean"]["percentage"] == 82.5
+    assert summary["overall"]["histogram"]["scores"]["accuracy"] == [0, 0, 0, 1, 1]
+    assert summary["groups"][0]["count"] == 2
+
+
+def test_summarize_drops_rows_with_missing_scores():
+    arrays = make_arrays([
+        [4, 3, 5, 2, 4, 65.0],
+        [np.nan, 3, 5, 2, 4, 70.0],  # 기준 점수 NULL, percentage는 있음
+        [4, 4, 4, 4, np.inf, 75.0],
+    ])
+    summary = summarize(arrays, group_by="recommender", trend="week")
+    assert summary["total"] == 1
+    assert summary["overall"]["mean"]["accuracy"] == 4.0
+    assert sum(summary["overall"]["histogram"]["scores"]["accuracy"]) == 1
+    assert [group["count"] for group in summary["groups"]] == [1]
@@ -0,0 +1,64 @@
+"""UploadSizeLimitMiddleware: 경로별 요청 본문 크기 상한"""
+from fastapi import FastAPI, Request
+from starlette.testclient import TestClient
+
+from upload_limits import MULTIPART_OVERHEAD_BYTES, UploadSizeLimitMiddleware
+
+FILE_LIMIT = 1024
+LIMIT = FILE_LIMIT + MULTIPART_OVERHEAD_BYTES
+
+
+def make_client():
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, limits={"/upload": FILE_LIMIT})
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        body = await request.body()
+        return {"size": len(body), "head": body[:16].decode()}
+
+    @app.post("/other")
+    async def other(request: Request):
+        return {"size": len(await request.body())}
+
+    return TestClient(app)
+
+
+def chunks(total, chunk_size=8 * 1024):
+    sent = 0
+    while sent < total:
+        size = min(chunk_size, total - sent)
+        sent += size
+        yield b"x" * size
+
+
+def test_content_length_over_limit_is_rejected_before_reading():
+    response = make_client().post("/upload", content=b"x" * (LIMIT + 1))
+    assert response.status_code == 413
+    assert "업로드 크기가 너무 큽니다" in response.json()["detail"]
+
+
+def test_chunked_body_over_limit_is_rejected_while_streaming():
+    response = make_client().post("/upload", content=chunks(LIMIT + 1))
+    assert response.request.headers.get("transfer-encoding") == "chunked"
+    assert "content-length" not in response.request.headers
+    assert response.status_code == 413
+    assert "업로드 크기가 너무 큽니다" in response.json()["detail"]
+
+
+def test_body_under_limit_passes_through_unchanged():
+    client = make_client()
+    body = b"hello-upload" + b"x" * (LIMIT - 12)
+    response = client.post("/upload", content=body)
+    assert response.status_code == 200
+    assert response.json() == {"size": LIMIT, "head": body[:16].decode()}
+
+    response = client.post("/upload", content=chunks(FILE_LIMIT))
+    assert response.status_code == 200
+    assert response.json()["size"] == FILE_LIMIT
+
+
+def test_unlimited_path_is_not_affected():
+    response = make_client().post("/other", content=b"x" * (LIMIT * 2))
+    assert response.status_code == 200
+    assert response.json() == {"size": LIMIT * 2}
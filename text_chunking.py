@@ -0,0 +1,107 @@
+"""
+LLM 프롬프트용 텍스트 분할
+- 토큰 수는 tiktoken(cl100k_base)으로 계산 (인코딩 파일을 받을 수 없으면 글자 수 기반 추정)
+- 문단 → 문장 → 글자 순으로 경계를 지키며 토큰 예산에 맞게 청크 분할
+- 문서 전체에서 고르게 뽑은 대표 발췌 (앞부분만 자르지 않음)
+"""
+import re
+import threading
+from typing import Callable, List, Optional
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+")
+
+_encoder = None
+_encoder_loaded = False
+_encoder_lock = threading.Lock()
+
+
+def _get_encoder():
+    """tiktoken 인코더 (최초 1회 로드, 실패하면 None → 추정치 사용)"""
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        with _encoder_lock:
+            if not _encoder_loaded:
+                try:
+                    import tiktoken
+                    _encoder = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    print(f"⚠️  tiktoken 인코딩 로드 실패, 글자 수로 토큰 추정: {e}")
+                    _encoder = None
+                _encoder_loaded = True
+    return _encoder
+
+
+def estimate_tokens(text: str) -> int:
+    """tiktoken 없이 토큰 수 추정 (영문/숫자 약 4자당 1토큰, 한글 등은 1자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+def count_tokens(text: str) -> int:
+    encoder = _get_encoder()
+    if encoder is None:
+        return estimate_tokens(text)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def _split_oversized(piece: str, max_tokens: int, counter: Callable[[str], int]) -> List[str]:
+    """토큰 예산보다 긴 문단을 문장 단위로, 그래도 길면 글자 수 비율로 자름"""
+    sentences = [s for s in _SENTENCE_BOUNDARY.split(piece) if s.strip()]
+    parts = []
+    for sentence in sentences:
+        tokens = counter(sentence)
+        if tokens <= max_tokens:
+            parts.append(sentence)
+            continue
+        step = max(1, int(len(sentence) * max_tokens / tokens))
+        parts.extend(sentence[i:i + step] for i in range(0, len(sentence), step))
+    return parts
+
+
+def split_into_token_chunks(text: str, max_tokens: int,
+                            counter: Optional[Callable[[str], int]] = None) -> List[str]:
+    """
+    문단 경계를 최대한 지키며 max_tokens 이하의 청크로 나눕니다.
+    (각 조각의 토큰 수를 한 번씩만 계산하므로 문서 길이에 선형)
+    """
+    counter = counter or count_tokens
+    paragraphs = [p.strip() for p in text.split('\n') if p.strip()]
+
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    for paragraph in paragraphs:
+        tokens = counter(paragraph)
+        pieces = [(paragraph, tokens)] if tokens <= max_tokens else [
+            (part, counter(part)) for part in _split_oversized(paragraph, max_tokens, counter)
+        ]
+        for piece, piece_tokens in pieces:
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append('\n'.join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
+
+
+def representative_samples(text: str, max_tokens: int, sample_count: int = 3,
+                           counter: Optional[Callable[[str], int]] = None) -> List[str]:
+    """
+    문서 전체에서 고르게 뽑은 발췌 목록 (합계 약 max_tokens 이하)
+    짧은 문서는 전체를 그대로 하나의 발췌로 반환합니다.
+    """
+    counter = counter or count_tokens
+    if counter(text) <= max_tokens:
+        return [text.strip()] if text.strip() else []
+
+    sample_count = max(1, sample_count)
+    pieces = split_into_token_chunks(text, max(1, max_tokens // sample_count), counter)
+    if len(pieces) <= sample_count:
+        return pieces
+    # 처음 / 중간 / 끝을 포함하도록 균등 간격으로 선택
+    last = len(pieces) - 1
+    indices = sorted({round(i * last / (sample_count - 1)) for i in range(sample_count)}) \
+        if sample_count > 1 else [0]
+    return [pieces[i] for i in indices]
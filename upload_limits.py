@@ -0,0 +1,64 @@
+"""
+업로드 경로별 요청 본문 크기 제한 (ASGI 미들웨어)
+- Content-Length가 상한을 넘으면 본문을 읽기 전에 413으로 거부
+- Content-Length가 없거나 틀려도 받는 동안 누적 바이트를 세어 상한을 넘는 순간 중단
+  (multipart 파서가 스풀 버퍼에 쓰기 전에 끊기므로 요청당 메모리/디스크 사용량이 상한으로 제한됨)
+"""
+from typing import Dict
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+# multipart 경계/헤더 등 파일 외 오버헤드 허용분
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+def _too_large_detail(limit: int) -> str:
+    return f"업로드 크기가 너무 큽니다. (최대 {max(1, limit // (1024 * 1024))}MB)"
+
+
+class UploadSizeLimitMiddleware:
+    """경로별 요청 본문 크기 상한 적용"""
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        # 파일 크기 상한 + multipart 오버헤드
+        self.limits = {path: limit + MULTIPART_OVERHEAD_BYTES for path, limit in limits.items()}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limits.get(scope["path"])
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = None
+        for name, value in scope.get("headers", []):
+            if name == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    pass
+                break
+
+        if content_length is not None and content_length > limit:
+            response = JSONResponse(status_code=413, content={"detail": _too_large_detail(limit - MULTIPART_OVERHEAD_BYTES)})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # 폼 파싱 중 발생 → FastAPI가 그대로 413 응답으로 변환
+                    raise HTTPException(status_code=413, detail=_too_large_detail(limit - MULTIPART_OVERHEAD_BYTES))
+            return message
+
+        await self.app(scope, limited_receive, send)
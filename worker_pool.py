@@ -0,0 +1,119 @@
+"""
+CPU 작업용 프로세스 풀
+- async 핸들러에서 await로 결과를 받아 이벤트 루프를 막지 않음
+- 동시에 실행되는 작업 수를 워커 수로 제한 (나머지는 asyncio에서 대기)
+- 사용률 / 대기 수 / 처리 시간 지표 제공
+"""
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+
+def _timed_call(fn: Callable, args: tuple) -> Tuple[Any, float]:
+    """워커 프로세스 안에서 실행 시간을 함께 측정"""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def _noop() -> None:
+    return None
+
+
+class WorkerPool:
+    """크기가 고정된 ProcessPoolExecutor 래퍼"""
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        initializer: Optional[Callable] = None,
+        initargs: tuple = ()
+    ):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 지표
+        self.busy = 0
+        self.waiting = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_run_seconds = 0.0
+        self.max_run_seconds = 0.0
+        self.total_wait_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 첫 작업 시점에 생성 (import 시 프로세스를 띄우지 않음)
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    # Windows 개발 환경과 동일하게 spawn 사용 (스레드가 있는 서버 프로세스를 fork하지 않음)
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=self.initializer,
+                        initargs=self.initargs
+                    )
+        return self._executor
+
+    def start(self) -> None:
+        """워커 프로세스를 미리 띄워 첫 요청의 프로세스 시작 지연을 없앱니다."""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_noop)
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """fn(*args)를 워커 프로세스에서 실행하고 결과를 반환합니다. (fn과 인자는 pickle 가능해야 함)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        queued_at = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.total_wait_seconds += time.perf_counter() - queued_at
+
+        self.busy += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(self._get_executor(), _timed_call, fn, args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.busy -= 1
+            self._semaphore.release()
+
+        self.completed += 1
+        self.total_run_seconds += elapsed
+        self.max_run_seconds = max(self.max_run_seconds, elapsed)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        finished = self.completed + self.failed
+        return {
+            "max_workers": self.max_workers,
+            "busy": self.busy,
+            "waiting": self.waiting,
+            "utilization": round(self.busy / self.max_workers, 3),
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_run_ms": round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            "max_run_ms": round(self.max_run_seconds * 1000, 2),
+            "avg_wait_ms": round(self.total_wait_seconds / finished * 1000, 2) if finished else 0.0,
+        }